@@ -5,42 +5,76 @@ Tiny CLI to run a debate between three toy LLMs with adversarial turn selection.
 Usage:
     python debate.py "Should we colonize Mars?" --turns 6 --seed 123
 """
-import argparse
 import sys
 import random
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional
 
 from models import Moderator, Opponent, Proponent, SimpleLLM, Stance
 
+# Banner line framing the transcript, and the fixed closing block built from it.
+_SEP = "=" * 80
+_FOOTER = f"\n\n{_SEP}\nDebate ended.\n{_SEP}"
 
-def make_models(seed: Optional[int] = None) -> List[SimpleLLM]:
+
+def make_models(
+    seed: Optional[int] = None, rng: Optional[random.Random] = None
+) -> List[SimpleLLM]:
     """Instantiate the default trio of debaters.
 
-    Supplying a seed makes all random choices reproducible which is useful for
-    debugging or demonstrations. Each model gets a unique offset seed so they
-    behave slightly differently while still being deterministic.
+    Supplying a seed (or an already seeded ``rng``, but not both) makes all
+    random choices reproducible which is useful for debugging or
+    demonstrations. Each model gets its own sub-seed drawn from that generator
+    so they behave slightly differently while still being deterministic.
+    Without either, the models are left unseeded.
+
+    Raises:
+        ValueError: If both ``seed`` and ``rng`` are given.
     """
 
-    a = Proponent(name="Argus (Pro)", tone="passionate", persuasion=0.8, seed=seed)
+    if seed is not None and rng is not None:
+        raise ValueError("Pass either seed or rng to make_models, not both.")
+    if rng is None and seed is not None:
+        rng = random.Random(seed)
+
+    def sub_seed() -> Optional[int]:
+        # Drawing sub-seeds from one generator keeps them distinct for every
+        # seed; the old ``seed and seed + 1`` offsets gave all models the same
+        # seed when ``seed`` was 0.
+        return rng.getrandbits(64) if rng is not None else None
+
+    a = Proponent(name="Argus (Pro)", tone="passionate", persuasion=0.8, seed=sub_seed())
     b = Opponent(
         name="Boreas (Con)",
         tone="skeptical",
         persuasion=0.7,
-        seed=seed and seed + 1,
+        seed=sub_seed(),
     )
     c = Moderator(
         name="Clio (Moderator)",
         tone="measured",
         persuasion=0.5,
-        seed=seed and seed + 2,
+        seed=sub_seed(),
     )
     return [a, b, c]
 
 
-def _models_by_stance(models: List[SimpleLLM], stance: Stance) -> List[Tuple[int, SimpleLLM]]:
-    """Return ``(index, model)`` pairs for all models that match ``stance``."""
+def _models_by_stance(models: List[SimpleLLM], stance: Stance) -> List[int]:
+    """Return the indices of all models that match ``stance``."""
 
-    return [(i, m) for i, m in enumerate(models) if m.stance == stance]
+    return [i for i, m in enumerate(models) if m.stance == stance]
+
+
+def _group_by_stance(models: List[SimpleLLM]) -> Dict[Stance, List[int]]:
+    """Map every stance to the indices of its models in a single pass.
+
+    The roster does not change during a debate, so the scheduler builds this
+    once instead of rescanning ``models`` on every turn.
+    """
+
+    by_stance: Dict[Stance, List[int]] = {s: [] for s in Stance}
+    for i, m in enumerate(models):
+        by_stance[m.stance].append(i)
+    return by_stance
 
 
 def _select_next_index(
@@ -48,12 +82,16 @@ def _select_next_index(
     current_idx: int,
     last_non_neutral: Optional[Stance],
     rng: random.Random,
+    by_stance: Optional[Dict[Stance, List[int]]] = None,
 ) -> int:
     """Decide which model should speak next.
 
     The rules enforce an adversarial flow: a "pro" statement is followed by a
     "con" one and vice versa. A neutral moderator may be followed by either.
     If no model of the required stance exists, any other model is chosen.
+
+    ``by_stance`` is an optional precomputed result of ``_group_by_stance``;
+    when omitted the candidates are looked up directly from ``models``.
     """
 
     current_model = models[current_idx]
@@ -70,76 +108,122 @@ def _select_next_index(
         else:
             required = rng.choice([Stance.PRO, Stance.CON])
 
-    candidates = _models_by_stance(models, required)
+    if by_stance is not None:
+        candidates = by_stance[required]
+    else:
+        candidates = _models_by_stance(models, required)
     if not candidates:
         # Fallback: choose any model other than the current one.
-        candidates = [(i, m) for i, m in enumerate(models) if i != current_idx]
+        candidates = [i for i in range(len(models)) if i != current_idx]
 
-    return rng.choice(candidates)[0]
+    return rng.choice(candidates)
 
 
-def run_debate(topic: str, turns: int = 6, seed: Optional[int] = None) -> str:
-    """Run a debate for ``topic`` between the default models and return text.
+def _plan_schedule(models: List[SimpleLLM], turns: int, rng: random.Random) -> List[int]:
+    """Return the index of the speaker for each of the ``turns`` turns.
 
-    The original CLI printed results directly to ``stdout``.  Returning the
-    complete transcript instead makes the function reusable by other
-    interfaces, such as a GUI.  The caller can choose whether to print or store
-    the output.
+    Speaker selection depends only on the models' stances and ``rng``, never on
+    the generated text, so the whole schedule can be worked out before any
+    model speaks. For a given seed the schedule is fully deterministic.
+    """
+
+    schedule: List[int] = []
+    by_stance = _group_by_stance(models)
+
+    # Select the initial speaker at random. ``current_idx`` will keep track of
+    # the speaker for each turn.
+    current_idx = rng.randrange(len(models))
+
+    # ``last_non_neutral`` remembers the last pro/con stance so a moderator can
+    # be followed by an opposing viewpoint.
+    last_non_neutral: Optional[Stance] = None
+
+    for _ in range(turns):
+        schedule.append(current_idx)
+
+        stance = models[current_idx].stance
+        if stance in (Stance.PRO, Stance.CON):
+            last_non_neutral = stance
+
+        current_idx = _select_next_index(
+            models, current_idx, last_non_neutral, rng, by_stance=by_stance
+        )
+
+    return schedule
+
+
+def run_debate_iter(topic: str, turns: int = 6, seed: Optional[int] = None) -> Iterator[str]:
+    """Run a debate for ``topic`` and yield the transcript piece by piece.
+
+    The first chunk is the topic banner, then one chunk per turn, then the
+    closing banner. Every chunk after the first starts with its own newline,
+    so concatenating all chunks gives exactly the text of ``run_debate``.
+    Interfaces such as the GUI can show each turn as soon as it is ready.
 
     Args:
         topic: The question or statement being debated.
         turns: Total number of speaker turns to execute.
         seed: Optional random seed for deterministic behavior.
 
-    Returns:
-        A single string containing the full debate transcript.
+    Yields:
+        Consecutive slices of the debate transcript.
     """
 
-    models = make_models(seed=seed)
+    # One generator drives the whole debate: it seeds the models and then plans
+    # the speaker order. Unseeded runs leave the models unseeded as well.
     rng = random.Random(seed)
+    models = make_models(rng=rng if seed is not None else None)
 
-    # Collect output lines in a list; this avoids printing during generation
-    # and allows the caller to handle the text however they wish.
-    lines: List[str] = []
+    yield f"{_SEP}\nDebate topic: {topic}\n{_SEP}"
 
-    lines.append("=" * 80)
-    lines.append(f"Debate topic: {topic}")
-    lines.append("=" * 80)
+    # The speaker order is planned up front; the loop below only generates text.
+    schedule = _plan_schedule(models, turns, rng)
 
-    # Select the initial speaker at random. ``current_idx`` will keep track of
-    # the speaker for each turn.
-    current_idx = rng.randrange(len(models))
-
-    # ``last_non_neutral`` remembers the last pro/con stance so a moderator can
-    # respond with an opposing viewpoint. ``last_output`` stores the full text of
-    # the previous message so the moderator can summarize it.
-    last_non_neutral: Optional[Stance] = None
+    # ``last_output`` stores the full text of the previous message so the
+    # moderator can summarize it.
     last_output: Optional[str] = None
 
-    for t in range(1, turns + 1):
+    # Speaker headers never change during a debate, so format them only once.
+    headers = [f"\n{m.name} ({m.stance.value}):" for m in models]
+
+    for t, current_idx in enumerate(schedule, start=1):
         model = models[current_idx]
 
         # Pass the previous output as context to allow summarization or rebuttal.
         out = model.generate(topic, context=last_output)
         last_output = out
 
-        lines.append(f"\n--- Turn {t} ---")
-        lines.append(f"\n{model.name} ({model.stance.value}):")
-        lines.append(out)
+        yield f"\n\n--- Turn {t} ---\n{headers[current_idx]}\n{out}"
 
-        if model.stance in (Stance.PRO, Stance.CON):
-            last_non_neutral = model.stance
+    yield _FOOTER
 
-        current_idx = _select_next_index(models, current_idx, last_non_neutral, rng)
 
-    lines.append("\n" + "=" * 80)
-    lines.append("Debate ended.")
-    lines.append("=" * 80)
+def run_debate(topic: str, turns: int = 6, seed: Optional[int] = None) -> str:
+    """Run a debate for ``topic`` between the default models and return text.
 
-    # Joining with newlines recreates the readable transcript format used by the CLI
-    return "\n".join(lines)
+    The original CLI printed results directly to ``stdout``.  Returning the
+    complete transcript instead makes the function reusable by other
+    interfaces, such as a GUI.  The caller can choose whether to print or store
+    the output.
+
+    Args:
+        topic: The question or statement being debated.
+        turns: Total number of speaker turns to execute.
+        seed: Optional random seed for deterministic behavior.
+
+    Returns:
+        A single string containing the full debate transcript.
+    """
+
+    # Each chunk carries its own leading newline, so a plain join recreates the
+    # readable transcript format used by the CLI.
+    return "".join(run_debate_iter(topic, turns=turns, seed=seed))
 
 def main(argv):
+    # ``argparse`` is only needed by the CLI, so importing it here keeps
+    # ``import debate`` (e.g. from the GUI) from paying for it.
+    import argparse
+
     parser = argparse.ArgumentParser(description="Tiny LLM debate CLI with adversarial turns")
     parser.add_argument("topic", help="Topic to debate (wrap in quotes)")
     parser.add_argument("--turns", type=int, default=6, help="Number of speaker turns")
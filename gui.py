@@ -16,16 +16,23 @@ Use a tool like ``pyinstaller`` to generate a ``.app`` bundle.
 
 from __future__ import annotations
 
+import queue
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from typing import Tuple
 
-from debate import run_debate
+from debate import run_debate_iter
 
 
 class DebateApp(tk.Tk):
     """Main application window for the debate GUI."""
 
+    # How often (ms) the main loop checks for new transcript text, and the
+    # maximum number of queued chunks written in one go.
+    DRAIN_INTERVAL_MS = 50
+    DRAIN_BATCH = 64
+
     def __init__(self) -> None:
         super().__init__()
         self.title("LLM Debate")
@@ -35,6 +42,15 @@ class DebateApp(tk.Tk):
         # Build all widgets (inputs, buttons, output box).
         self._build_widgets()
 
+        # Tk widgets must only be touched from the main thread. The debate
+        # worker puts ``(run_id, chunk)`` pairs on this queue and
+        # ``_drain_queue`` moves them into the text box from Tk's event loop.
+        # ``_run_id`` identifies the latest run so chunks from a previous,
+        # possibly still running, worker can be discarded.
+        self._queue: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+        self._run_id = 0
+        self.after(self.DRAIN_INTERVAL_MS, self._drain_queue)
+
     # ------------------------------------------------------------------
     # UI Construction helpers
     # ------------------------------------------------------------------
@@ -66,8 +82,10 @@ class DebateApp(tk.Tk):
             row=2, column=0, columnspan=4, pady=5
         )
 
-        # Row 3: text output area with a vertical scrollbar
-        self.output = tk.Text(self, wrap="word")
+        # Row 3: text output area with a vertical scrollbar. ``undo=False`` is
+        # Tk's default; it is spelled out because the transcript is only ever
+        # written by the program.
+        self.output = tk.Text(self, wrap="word", undo=False)
         scroll = tk.Scrollbar(self, command=self.output.yview)
         self.output.configure(yscrollcommand=scroll.set)
         self.output.grid(row=3, column=0, columnspan=3, sticky="nsew", padx=(5, 0), pady=5)
@@ -103,16 +121,49 @@ class DebateApp(tk.Tk):
             return
 
         turns = self.turns_var.get()
+
+        # Start a new run: forget anything still queued from the previous one
+        # before clearing the text box.
+        self._run_id += 1
+        run_id = self._run_id
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
         self.output.delete("1.0", tk.END)
 
         def worker() -> None:
-            """Run the debate and display results once complete."""
-            transcript = run_debate(topic, turns=turns, seed=seed)
-            self.output.insert(tk.END, transcript)
+            """Run the debate and display each turn as soon as it is ready."""
+            for chunk in run_debate_iter(topic, turns=turns, seed=seed):
+                # Queue the chunk so the text box fills in progressively
+                # instead of all at once at the end.
+                self._queue.put((run_id, chunk))
 
         # Running in a thread keeps the UI responsive during generation.
         threading.Thread(target=worker, daemon=True).start()
 
+    def _drain_queue(self) -> None:
+        """Write pending transcript chunks to the text box, then reschedule."""
+
+        chunks = []
+        try:
+            for _ in range(self.DRAIN_BATCH):
+                run_id, chunk = self._queue.get_nowait()
+                # A worker from an earlier run may still be producing; only
+                # the latest run's transcript belongs in the text box.
+                if run_id == self._run_id:
+                    chunks.append(chunk)
+        except queue.Empty:
+            pass
+
+        if chunks:
+            # One insert and one scroll per batch rather than per chunk.
+            self.output.insert(tk.END, "".join(chunks))
+            self.output.see(tk.END)
+
+        self.after(self.DRAIN_INTERVAL_MS, self._drain_queue)
+
     def _copy_output(self) -> None:
         """Copy the transcript to the clipboard for easy sharing."""
 
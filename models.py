@@ -6,13 +6,65 @@ plausible-sounding arguments. No external API is needed.
 
 The file intentionally aims to be beginner friendly; heavy commenting is used to
 explain the design and make future modifications easier.
+
+Performance note: generating a turn is a few random picks plus string
+formatting. There are no numeric loops or arrays, so JIT/AOT tools such as
+Numba or Cython have nothing to accelerate here (they handle strings poorly).
+Keep the templates as precomputed constants instead; if a real LLM backend is
+added, its cost will be inference, not Python code.
 """
 
-from dataclasses import dataclass, field
 from enum import Enum
 import random
 import textwrap
-from typing import List, Optional
+from typing import Optional, Sequence
+
+# A single shared wrapper, since the configuration never changes between calls.
+# This only skips constructing a wrapper per turn; the wrapping itself still
+# accounts for nearly all of the cost.
+_WRAPPER = textwrap.TextWrapper(width=80)
+
+# Generator shared by every unseeded model: without a seed there is nothing to
+# reproduce, so one generator serves them all instead of one per instance.
+_SHARED_RNG = random.Random()
+
+# Template options live in module-level tuples so ``generate`` does not rebuild
+# the same lists on every call. Entries containing ``{topic}`` are formatted
+# after one has been picked.
+_OPENINGS = (
+    "I believe",
+    "It's clear to me",
+    "From my point of view",
+    "Consider that",
+)
+_CLOSINGS = (
+    "That's why I'm convinced.",
+    "This is the heart of the matter.",
+    "In short, the evidence points there.",
+    "Ultimately, the conclusion follows.",
+)
+_PRO_REASONS = (
+    "{topic} would unlock new opportunities and drive innovation.",
+    "{topic} addresses urgent challenges and creates long-term value.",
+    "{topic} empowers people and expands our options.",
+)
+_PRO_MODIFIERS = ("Moreover,", "Importantly,", "Significantly,")
+_CON_REASONS = (
+    "{topic} carries risks that could be overlooked.",
+    "{topic} might create unintended negative consequences.",
+    "{topic} could be costly and favor the wrong actors.",
+)
+_CON_MODIFIERS = ("However,", "On the other hand,", "Yet,")
+_MOD_REASONS = (
+    "The pros and cons deserve clear comparison.",
+    "Key trade-offs need to be weighed transparently.",
+    "We should ask who benefits and who bears the cost.",
+)
+_MOD_SUGGESTIONS = (
+    "A pilot program might help.",
+    "Clear metrics could guide decisions.",
+    "Stakeholder input is essential.",
+)
 
 
 class Stance(str, Enum):
@@ -23,7 +75,6 @@ class Stance(str, Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
 class SimpleLLM:
     """Minimalistic language model used by the debate engine.
 
@@ -31,22 +82,34 @@ class SimpleLLM:
         name: Name displayed when the model speaks.
         tone: Short descriptor inserted into templates (e.g., "passionate").
         persuasion: 0..1 value representing how persuasive the model tries to be.
-        seed: Optional random seed so outputs can be made reproducible. Each model
-            gets its own independent pseudo random generator.
+        seed: Optional random seed so outputs can be made reproducible. A seeded
+            model gets its own independent pseudo random generator; unseeded
+            models share a single module-level generator.
     """
 
-    name: str
-    tone: str
-    persuasion: float
-    seed: Optional[int] = None
-    # ``seed_state`` is created after initialization because ``random.Random``
-    # cannot be represented directly as a dataclass default.
-    seed_state: random.Random = field(init=False, repr=False)
+    # ``__slots__`` keeps instances small and attribute access fast; a plain
+    # ``__init__`` is also cheaper to call than a generated dataclass one.
+    __slots__ = ("name", "tone", "persuasion", "seed", "seed_state")
 
-    def __post_init__(self) -> None:
+    def __init__(
+        self, name: str, tone: str, persuasion: float, seed: Optional[int] = None
+    ) -> None:
+        self.name = name
+        self.tone = tone
         # Clamp persuasion to the valid range and create an RNG using the seed.
-        self.persuasion = max(0.0, min(1.0, self.persuasion))
-        self.seed_state = random.Random(self.seed)
+        self.persuasion = max(0.0, min(1.0, persuasion))
+        self.seed = seed
+        # Only seeded models need a private generator; unseeded ones share
+        # ``_SHARED_RNG``.
+        self.seed_state: random.Random = (
+            random.Random(seed) if seed is not None else _SHARED_RNG
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, tone={self.tone!r}, "
+            f"persuasion={self.persuasion!r}, seed={self.seed!r})"
+        )
 
     # ------------------------------------------------------------------
     # Core interface
@@ -57,7 +120,7 @@ class SimpleLLM:
 
         return Stance.NEUTRAL
 
-    def _pick(self, options: List[str]) -> str:
+    def _pick(self, options: Sequence[str]) -> str:
         """Helper to deterministically pick from a list using the model RNG."""
 
         return self.seed_state.choice(options)
@@ -75,26 +138,16 @@ class SimpleLLM:
         """
 
         # Simple templates provide varied yet deterministic phrasing.
-        opening = self._pick([
-            "I believe",
-            "It's clear to me",
-            "From my point of view",
-            "Consider that",
-        ])
+        opening = self._pick(_OPENINGS)
 
         stance_phrase = self._stance_phrase(topic, context)
         reasons = self._reasons(topic, context)
 
-        closing = self._pick([
-            "That's why I'm convinced.",
-            "This is the heart of the matter.",
-            "In short, the evidence points there.",
-            "Ultimately, the conclusion follows.",
-        ])
+        closing = self._pick(_CLOSINGS)
 
         output = f"{opening} {stance_phrase} {reasons} {closing}"
-        # ``textwrap.fill`` wraps the string nicely for terminal output.
-        return textwrap.fill(output, width=80)
+        # Wrapping at 80 columns keeps the output readable in a terminal.
+        return _WRAPPER.fill(output)
 
     # The following methods are intentionally left abstract. Subclasses provide
     # concrete implementations tailored to their perspective.
@@ -106,6 +159,8 @@ class SimpleLLM:
 
 
 class Proponent(SimpleLLM):
+    __slots__ = ()
+
     @property
     def stance(self) -> Stance:
         return Stance.PRO
@@ -114,17 +169,8 @@ class Proponent(SimpleLLM):
         return f"we should support {topic}"
 
     def _reasons(self, topic, context):
-        candidates = [
-            f"{topic} would unlock new opportunities and drive innovation.",
-            f"{topic} addresses urgent challenges and creates long-term value.",
-            f"{topic} empowers people and expands our options."
-        ]
-        reason = self._pick(candidates)
-        modifier = self._pick([
-            "Moreover,",
-            "Importantly,",
-            "Significantly,"
-        ])
+        reason = self._pick(_PRO_REASONS).format(topic=topic)
+        modifier = self._pick(_PRO_MODIFIERS)
         confidence = self._confidence_word()
         return f"{modifier} {reason} {confidence}"
 
@@ -137,6 +183,8 @@ class Proponent(SimpleLLM):
 
 
 class Opponent(SimpleLLM):
+    __slots__ = ()
+
     @property
     def stance(self) -> Stance:
         return Stance.CON
@@ -145,17 +193,8 @@ class Opponent(SimpleLLM):
         return f"we should be cautious about {topic}"
 
     def _reasons(self, topic, context):
-        candidates = [
-            f"{topic} carries risks that could be overlooked.",
-            f"{topic} might create unintended negative consequences.",
-            f"{topic} could be costly and favor the wrong actors."
-        ]
-        reason = self._pick(candidates)
-        modifier = self._pick([
-            "However,",
-            "On the other hand,",
-            "Yet,"
-        ])
+        reason = self._pick(_CON_REASONS).format(topic=topic)
+        modifier = self._pick(_CON_MODIFIERS)
         caution = self._caution_word()
         return f"{modifier} {reason} {caution}"
 
@@ -168,6 +207,8 @@ class Opponent(SimpleLLM):
 
 
 class Moderator(SimpleLLM):
+    __slots__ = ()
+
     @property
     def stance(self) -> Stance:
         return Stance.NEUTRAL
@@ -181,15 +222,6 @@ class Moderator(SimpleLLM):
         return f"let's examine {topic} from several angles"
 
     def _reasons(self, topic, context):
-        candidates = [
-            "The pros and cons deserve clear comparison.",
-            "Key trade-offs need to be weighed transparently.",
-            "We should ask who benefits and who bears the cost."
-        ]
-        reason = self._pick(candidates)
-        suggestion = self._pick([
-            "A pilot program might help.",
-            "Clear metrics could guide decisions.",
-            "Stakeholder input is essential."
-        ])
+        reason = self._pick(_MOD_REASONS)
+        suggestion = self._pick(_MOD_SUGGESTIONS)
         return f"{reason} {suggestion}"
\ No newline at end of file